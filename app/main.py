@@ -1,13 +1,21 @@
 import random
-from fastapi import FastAPI, HTTPException
+from operator import itemgetter
+from typing import List, Optional
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from datetime import datetime, timedelta
 from .models.message import Message, Messages
 from .models.report import Report
-from .models.usage import UsageItem, UsageResponse
+from .models.usage import UsageResponse
 from .utils.credits import calculate_credits
 
-app = FastAPI()
+# Create FastAPI instance with custom docs and openapi url
+app = FastAPI(
+    docs_url="/api/docs",
+    openapi_url="/api/openapi.json",
+    default_response_class=ORJSONResponse,
+)
 
 # Configure CORS with multiple origins
 origins = ["http://localhost:3000", "https://inc.isv.ee"]
@@ -20,9 +28,6 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Create FastAPI instance with custom docs and openapi url
-app = FastAPI(docs_url="/api/docs", openapi_url="/api/openapi.json")
-
 # Sample queries remain the same
 SAMPLE_QUERIES = [
     ("Who were the main directors of the French New Wave movement?", None),
@@ -42,90 +47,127 @@ SAMPLE_QUERIES = [
     ("Who were the key figures in the Civil Rights Movement?", None),
 ]
 
+# Messages are only ever drawn from SAMPLE_QUERIES, so price each one up front
+_PRECOMPUTED_CREDITS = {
+    query: calculate_credits(query)["credits_used"] for query, _ in SAMPLE_QUERIES
+}
 
-@app.get("/api/v1/users/{user_id}/messages", response_model=dict)
-async def get_user_messages(user_id: int):
-    if user_id not in [1, 2, 3]:
-        raise HTTPException(status_code=404, detail="User not found")
+# Reports are static, so build the models once at import
+_REPORTS = {
+    3345: Report(id=3345, name="Discounted Demo Report", credit_cost=1.0),
+    5392: Report(id=5392, name="Customised Usage Report", credit_cost=5.0),
+    8806: Report(id=8806, name="Fully Constructed Report", credit_cost=4.0),
+    1124: Report(id=1124, name="Short Report", credit_cost=3.0),
+}
 
+
+def _generate_messages(user_id: int) -> List[dict]:
     end_date = datetime.now()
     start_date = end_date - timedelta(days=7)
     messages = []
-    message_id = 1000
     num_messages = random.randint(20, 30)
 
-    for _ in range(num_messages):
-        random_timestamp = start_date + timedelta(
-            seconds=random.randint(0, int((end_date - start_date).total_seconds()))
-        )
-        query, report_id = random.choice(SAMPLE_QUERIES)
+    # Draw all queries and timestamp offsets up front rather than per message
+    picks = random.choices(SAMPLE_QUERIES, k=num_messages)
+    span_seconds = int((end_date - start_date).total_seconds())
+    offsets = [random.randint(0, span_seconds) for _ in range(num_messages)]
+
+    # Sort on the integer offsets, which order the same way as the timestamps,
+    # and only format the timestamps afterwards
+    entries = sorted(
+        zip(offsets, range(1000, 1000 + num_messages), picks), key=itemgetter(0)
+    )
+
+    # Offsets are whole seconds, so every timestamp shares start_date's
+    # microseconds; format that suffix once, matching what isoformat() emits
+    fraction = f".{start_date.microsecond:06d}" if start_date.microsecond else ""
+
+    for offset, message_id, (query, report_id) in entries:
+        ts = start_date + timedelta(seconds=offset)
         message = {
             "id": message_id,
             "text": query,
-            "timestamp": random_timestamp.isoformat() + "Z",
+            "timestamp": (
+                f"{ts.year:04d}-{ts.month:02d}-{ts.day:02d}"
+                f"T{ts.hour:02d}:{ts.minute:02d}:{ts.second:02d}{fraction}Z"
+            ),
         }
         if report_id:
             message["report_id"] = report_id
         messages.append(message)
-        message_id += 1
 
-    messages.sort(key=lambda x: x["timestamp"])
-    return {"messages": messages}
+    return messages
+
+
+def _get_report(report_id: int) -> Optional[Report]:
+    return _REPORTS.get(report_id)
+
+
+@app.get("/api/v1/users/{user_id}/messages", response_model=dict)
+async def get_user_messages(user_id: int):
+    if user_id not in [1, 2, 3]:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    return {"messages": _generate_messages(user_id)}
 
 
 @app.get("/api/v1/messages/{user_id}/current", response_model=Messages)
 async def get_current_period_messages(user_id: int):
-    response = await get_user_messages(user_id)
-    messages = [Message(**msg) for msg in response["messages"]]
+    if user_id not in [1, 2, 3]:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    messages = [Message(**msg) for msg in _generate_messages(user_id)]
     return Messages(messages=messages)
 
 
 @app.get("/api/v1/reports/{report_id}", response_model=Report)
-async def get_report(report_id: int):
-    report_data = {
-        3345: {"id": 3345, "name": "Discounted Demo Report", "credit_cost": 1.0},
-        5392: {"id": 5392, "name": "Customised Usage Report", "credit_cost": 5.0},
-        8806: {
-            "id": 8806,
-            "name": "Fully Constructed Report",
-            "credit_cost": 4.0,
-        },
-        1124: {"id": 1124, "name": "Short Report", "credit_cost": 3.0},
-    }
-
-    if report_id not in report_data:
+async def get_report(report_id: int, response: Response):
+    report = _get_report(report_id)
+    if report is None:
         raise HTTPException(status_code=404, detail="Report not found")
 
-    return Report(**report_data[report_id])
+    # Report definitions never change, so let clients and CDNs reuse them
+    response.headers["Cache-Control"] = "public, max-age=86400"
+    return report
 
 
-@app.get("/api/v1/users/{user_id}/usage", response_model=UsageResponse)
+# The usage payload is assembled as plain dicts in the UsageResponse shape;
+# the model is only referenced for the OpenAPI schema, not for validation
+@app.get(
+    "/api/v1/users/{user_id}/usage",
+    response_model=None,
+    responses={200: {"model": UsageResponse}},
+)
 async def get_usage(user_id: int):
     if user_id not in [1, 2, 3]:
         raise HTTPException(status_code=404, detail="User not found")
 
-    messages = (await get_current_period_messages(user_id)).messages
+    # Work on the raw message dicts; only /messages/current needs Message models
+    messages = _generate_messages(user_id)
     usage = []
 
     for message in messages:
-        usage_item = UsageItem(
-            message_id=message.id,
-            timestamp=message.timestamp.isoformat(),
-            credits_used=0,
-        )
+        report_id = message.get("report_id")
 
-        if message.report_id:
-            try:
-                report = await get_report(message.report_id)
-                usage_item.report_name = report.name
-                usage_item.credits_used = report.credit_cost
-            except HTTPException:
-                usage_item.credits_used = calculate_credits(message.text)[
-                    "credits_used"
-                ]
+        # Unknown report ids fall back to pricing the message text
+        report = _REPORTS.get(report_id) if report_id else None
+        if report is not None:
+            report_name = report.name
+            credits_used = float(report.credit_cost)
         else:
-            usage_item.credits_used = calculate_credits(message.text)["credits_used"]
-
-        usage.append(usage_item)
+            report_name = None
+            credits_used = _PRECOMPUTED_CREDITS.get(message["text"])
+            if credits_used is None:
+                credits_used = calculate_credits(message["text"])["credits_used"]
+
+        usage.append(
+            {
+                "message_id": message["id"],
+                # Keep the "+00:00" offset the parsed Message timestamp used to emit
+                "timestamp": message["timestamp"][:-1] + "+00:00",
+                "report_name": report_name,
+                "credits_used": credits_used,
+            }
+        )
 
-    return UsageResponse(usage=usage)
+    return {"usage": usage}
@@ -1,3 +1,5 @@
+import pytest
+
 from utils.credits import calculate_credits
 
 
@@ -136,3 +138,13 @@ def test_special_characters():
         "palindrome_multiplier": 1,
     }
     assert calculate_credits(message) == expected_result
+
+
+def test_cached_result_is_read_only():
+    # Tests that repeated calls share a cached result that cannot be mutated
+    message = "Hello! @#$% World?"
+    result = calculate_credits(message)
+
+    assert calculate_credits(message) is result
+    with pytest.raises(TypeError):
+        result["credits_used"] = 0
@@ -1,8 +1,14 @@
 import re
-from decimal import Decimal, ROUND_HALF_UP
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping
 
+_WORD_RE = re.compile(r"[a-zA-Z'-]+")
+_NONALNUM_BYTES = bytes(c for c in range(128) if not chr(c).isalnum())
 
-def calculate_credits(text: str) -> dict:
+
+@lru_cache(maxsize=1024)
+def calculate_credits(text: str) -> Mapping[str, float]:
     """
     The credit calculation system starts with a base cost of 1 credit and
     adds additional charges based on several rules: 0.05 credits per character,
@@ -13,115 +19,127 @@ def calculate_credits(text: str) -> dict:
     reduction for messages with all unique words. After applying these
     rules and ensuring a minimum of 1 credit, the total is doubled
     if the message is a palindrome (ignoring spaces and case).
+
+    All intermediate costs are kept as integer hundredths of a credit (cents),
+    so every rule is exact and no rounding is required before the final
+    conversion to float.
+
+    Results are memoized per text, so the returned mapping is read-only to
+    keep cached entries from being mutated by callers.
     """
 
-    base_cost = Decimal("1")
-    char_count_cost = Decimal("0")
-    word_length_cost = Decimal("0")
-    third_vowel_cost = Decimal("0")
-    length_penalty = Decimal("0")
-    unique_word_bonus = Decimal("0")
-    palindrome_multiplier = Decimal("1")
+    base_cost_cents = 100
+    char_count_cost_cents = 0
+    word_length_cost_cents = 0
+    third_vowel_cost_cents = 0
+    length_penalty_cents = 0
+    unique_word_bonus_cents = 0
+    palindrome_multiplier = 1
 
     # Add a check if a message is empty, simply return base cost as 1
     if text == "":
-        credits_used = base_cost
-        return {
-            "credits_used": float(credits_used),
-            "base_cost": float(base_cost),
-            "char_count_cost": float(char_count_cost),
-            "word_length_cost": float(word_length_cost),
-            "third_vowel_cost": float(third_vowel_cost),
-            "length_penalty": float(length_penalty),
-            "unique_word_bonus": float(unique_word_bonus),
-            "palindrome_multiplier": float(palindrome_multiplier),
-        }
+        credits_used_cents = base_cost_cents
+        return MappingProxyType(
+            {
+                "credits_used": credits_used_cents / 100,
+                "base_cost": base_cost_cents / 100,
+                "char_count_cost": char_count_cost_cents / 100,
+                "word_length_cost": word_length_cost_cents / 100,
+                "third_vowel_cost": third_vowel_cost_cents / 100,
+                "length_penalty": length_penalty_cents / 100,
+                "unique_word_bonus": unique_word_bonus_cents / 100,
+                "palindrome_multiplier": float(palindrome_multiplier),
+            }
+        )
 
     # Character Count: Add 0.05 credits for each character in the message
     num_chars = len(text)
-    char_count_cost = Decimal("0.05") * Decimal(num_chars)
+    char_count_cost_cents = 5 * num_chars
 
     # Word length multipliers
     # For words of 1-3 characters: add 0.1 credits per word
     # For words of 4-7 characters: add 0.2 credits per word
     # For words of 8+ characters: add 0.3 credits per word
     # Let's assume we only consider English language.
-    words = re.findall(r"[a-zA-Z'-]+", text)
-    for word in words:
-        length = len(word)
-        if 1 <= length <= 3:
-            word_length_cost += Decimal("0.1")
-        elif 4 <= length <= 7:
-            word_length_cost += Decimal("0.2")
-        elif length >= 8:
-            word_length_cost += Decimal("0.3")
+    words = _WORD_RE.findall(text)
+    # Bucket the words by length first and price each bucket once
+    short_words = medium_words = 0
+    for length in map(len, words):
+        if length <= 3:
+            short_words += 1
+        elif length <= 7:
+            medium_words += 1
+    long_words = len(words) - short_words - medium_words
+    word_length_cost_cents = 10 * short_words + 20 * medium_words + 30 * long_words
 
     # Third Vowels: Apply to the entire message
     # If any third (i.e. 3rd, 6th, 9th) character is an uppercase
     # or lowercase vowel (a, e, i, o, u) add 0.3 credits for each occurrence
-    for i, char in enumerate(text, start=1):
-        if i % 3 == 0 and char.lower() in "aeiou":
-            third_vowel_cost += Decimal("0.3")
+    third_chars = text[2::3]
+    third_vowels = sum(third_chars.count(vowel) for vowel in "aeiouAEIOU")
+    third_vowel_cost_cents = 30 * third_vowels
 
     # Length penalty
     # If the message length exceeds 100 characters, add a penalty of 5 credits
     if num_chars > 100:
-        length_penalty = Decimal("5")
+        length_penalty_cents = 500
 
     # Unique word bonus
     # If all words in the message are unique (case-sensitive), subtract 2 credits
     # from the total cost (remember the minimum cost should still be 1 credit)
     # This will grant a bonus if the message consists of a single word
-    if len(set(words)) == len(words) and words:
-        unique_word_bonus = Decimal("-2")
+    # Stop at the first repeated word instead of hashing the whole list
+    seen_words = set()
+    for word in words:
+        if word in seen_words:
+            break
+        seen_words.add(word)
+    else:
+        if words:
+            unique_word_bonus_cents = -200
 
     # Calculate total credits before palindrome check
-    credits = (
-        base_cost
-        + char_count_cost
-        + word_length_cost
-        + third_vowel_cost
-        + length_penalty
-        + unique_word_bonus
+    credits_cents = (
+        base_cost_cents
+        + char_count_cost_cents
+        + word_length_cost_cents
+        + third_vowel_cost_cents
+        + length_penalty_cents
+        + unique_word_bonus_cents
     )
 
     # Ensure minimum cost before palindrome multiplier
-    credits = max(credits, Decimal("1"))
+    credits_cents = max(credits_cents, 100)
 
     # Palindrome check
     # This is at the end: double the total cost after all other rules have been applied
-    processed_message = re.sub(r"[^a-zA-Z0-9]", "", text.lower())
-    if processed_message == processed_message[::-1] and processed_message != "":
-        palindrome_multiplier = Decimal("2")
-        credits *= palindrome_multiplier
-
-    credits_used = credits
-
-    # Round the costs to 2 decimal places
-    rounding_precision = Decimal(".01")
-    credits_used = credits_used.quantize(rounding_precision, rounding=ROUND_HALF_UP)
-    char_count_cost = char_count_cost.quantize(
-        rounding_precision, rounding=ROUND_HALF_UP
-    )
-    word_length_cost = word_length_cost.quantize(
-        rounding_precision, rounding=ROUND_HALF_UP
-    )
-    third_vowel_cost = third_vowel_cost.quantize(
-        rounding_precision, rounding=ROUND_HALF_UP
-    )
-    length_penalty = length_penalty.quantize(rounding_precision, rounding=ROUND_HALF_UP)
-    unique_word_bonus = unique_word_bonus.quantize(
-        rounding_precision, rounding=ROUND_HALF_UP
+    # Non-ASCII characters are dropped by the encode, the remaining
+    # non-alphanumeric ASCII bytes by the translate
+    processed_message = (
+        text.lower().encode("ascii", "ignore").translate(None, _NONALNUM_BYTES)
     )
+    # Walk inwards from both ends so most messages bail out on the first pair
+    left, right = 0, len(processed_message) - 1
+    while left < right and processed_message[left] == processed_message[right]:
+        left += 1
+        right -= 1
+    if processed_message and left >= right:
+        palindrome_multiplier = 2
+        credits_cents *= palindrome_multiplier
+
+    credits_used_cents = credits_cents
 
-    # Return a dictionary with all the costs
-    return {
-        "credits_used": float(credits_used),
-        "base_cost": float(base_cost),
-        "char_count_cost": float(char_count_cost),
-        "word_length_cost": float(word_length_cost),
-        "third_vowel_cost": float(third_vowel_cost),
-        "length_penalty": float(length_penalty),
-        "unique_word_bonus": float(unique_word_bonus),
-        "palindrome_multiplier": float(palindrome_multiplier),
-    }
+    # Convert from cents back to credits once; every component is already a
+    # whole number of cents, so this matches rounding to 2 decimal places
+    return MappingProxyType(
+        {
+            "credits_used": credits_used_cents / 100,
+            "base_cost": base_cost_cents / 100,
+            "char_count_cost": char_count_cost_cents / 100,
+            "word_length_cost": word_length_cost_cents / 100,
+            "third_vowel_cost": third_vowel_cost_cents / 100,
+            "length_penalty": length_penalty_cents / 100,
+            "unique_word_bonus": unique_word_bonus_cents / 100,
+            "palindrome_multiplier": float(palindrome_multiplier),
+        }
+    )